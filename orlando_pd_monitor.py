@@ -5,29 +5,213 @@ Monitors Orlando Police Department active calls for specific locations and sends
 """
 
 import argparse
+import hashlib
 import sys
 import time
 import logging
+import sqlite3
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
-import xml.etree.ElementTree as ET
-import resend
-from typing import Optional, List, Dict
-from dataclasses import dataclass
-from datetime import datetime
+from io import BytesIO
+from lxml import etree as ET
+import orjson
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Iterator, Tuple
+from dataclasses import dataclass, field
 
 # Configuration defaults
 DEFAULT_POLL_INTERVAL = 30  # seconds
+MAX_IDLE_POLL_INTERVAL = 120  # seconds, cap for backing off while the feed is unchanged
+MAX_TRACKED_INCIDENTS = 10000  # notified incidents cached in memory for deduplication
+NOTIFICATION_RETENTION = 7 * 24 * 60 * 60  # seconds a notified incident is remembered on disk
+PRUNE_INTERVAL = 60 * 60  # seconds between purges of expired incidents
+MAX_CONCURRENT_NOTIFICATIONS = 2  # ntfy.sh message and email batch sent side by side
+RESEND_BATCH_LIMIT = 100  # maximum emails per Resend batch request
 DEFAULT_SEARCH_TERM = "FORELAND"
+DEFAULT_STATE_FILE = "tracker.db"
 ORLANDO_PD_URL = "https://www1.cityoforlando.net/opd/activecalls/activecadpolice.xml"
+RESEND_BATCH_URL = "https://api.resend.com/emails/batch"
+
+# Notification templates, filled in with str.format_map() from template_fields()
+NTFY_MESSAGE_TEMPLATE = """ORLANDO PD ALERT: {search_term}
+
+Type: {call_type}
+Time: {datetime_str}
+Location: {location}
+District: {district}
+Incident: {incident_number}
+
+This call contains "{search_term}" in the location field."""
+
+NTFY_MESSAGE_SEPARATOR = "\n\n---\n\n"  # Between calls coalesced into one ntfy.sh message
+NTFY_MESSAGE_LIMIT = 4096  # ntfy.sh sends longer message bodies as attachments
+
+EMAIL_SUBJECT_TEMPLATE = "Orlando PD Alert: {search_term} - {call_type}"
+
+EMAIL_HTML_TEMPLATE = """<html>
+<body>
+    <h2>🚨 Orlando PD Alert: {search_term}</h2>
+    
+    <table style="border-collapse: collapse; width: 100%; max-width: 600px;">
+        <tr style="background-color: #f8f9fa;">
+            <td style="padding: 12px; border: 1px solid #ddd; font-weight: bold;">Incident Type:</td>
+            <td style="padding: 12px; border: 1px solid #ddd;">{call_type}</td>
+        </tr>
+        <tr>
+            <td style="padding: 12px; border: 1px solid #ddd; font-weight: bold;">Time:</td>
+            <td style="padding: 12px; border: 1px solid #ddd;">{datetime_str}</td>
+        </tr>
+        <tr style="background-color: #f8f9fa;">
+            <td style="padding: 12px; border: 1px solid #ddd; font-weight: bold;">Location:</td>
+            <td style="padding: 12px; border: 1px solid #ddd; color: #d73502; font-weight: bold;">{location}</td>
+        </tr>
+        <tr>
+            <td style="padding: 12px; border: 1px solid #ddd; font-weight: bold;">District:</td>
+            <td style="padding: 12px; border: 1px solid #ddd;">{district}</td>
+        </tr>
+        <tr style="background-color: #f8f9fa;">
+            <td style="padding: 12px; border: 1px solid #ddd; font-weight: bold;">Incident Number:</td>
+            <td style="padding: 12px; border: 1px solid #ddd;">{incident_number}</td>
+        </tr>
+    </table>
+    
+    <p style="margin-top: 20px; padding: 12px; background-color: #fff3cd; border: 1px solid #ffeeba; border-radius: 4px;">
+        <strong>Alert Reason:</strong> This call contains "<strong>{search_term}</strong>" in the location field.
+    </p>
+    
+    <p style="color: #6c757d; font-size: 12px; margin-top: 20px;">
+        This is an automated notification from Orlando PD Monitor.<br>
+        Data source: Orlando Police Department Active Calls Feed
+    </p>
+</body>
+</html>
+"""
+
+EMAIL_TEXT_TEMPLATE = """Orlando PD Alert: {search_term}
+
+Incident Type: {call_type}
+Time: {datetime_str}
+Location: {location}
+District: {district}
+Incident Number: {incident_number}
+
+Alert Reason: This call contains "{search_term}" in the location field.
+
+---
+This is an automated notification from Orlando PD Monitor.
+Data source: Orlando Police Department Active Calls Feed
+"""
+
+def create_http_session() -> requests.Session:
+    """
+    Create the shared HTTP session used for the Orlando PD feed and Resend API.
+    
+    Reusing one session keeps TLS connections alive between requests instead of
+    handshaking again every time, and retries transient gateway errors on
+    idempotent requests.
+    
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Orlando-PD-Monitor/1.0',
+        'Accept-Encoding': 'gzip, deflate'
+    })
+    
+    adapter = HTTPAdapter(
+        pool_connections=3,  # Orlando PD feed, Resend API and ntfy.sh hosts
+        pool_maxsize=2,
+        max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+HTTP_SESSION = create_http_session()
+
+# Shared worker pool for sending ntfy.sh and email notifications in parallel
+NOTIFICATION_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_NOTIFICATIONS,
+    thread_name_prefix="notify"
+)
+
+def incident_key(incident_number: str) -> int:
+    """
+    Convert an incident number into a compact integer key for deduplication.
+    
+    Incident numbers look like "2025-00192513", so dropping the dash gives an
+    integer that hashes without walking a string. Anything unexpected falls
+    back to the string's hash.
+    
+    Args:
+        incident_number: Incident number from the Orlando PD feed
+        
+    Returns:
+        Integer key identifying the incident
+    """
+    try:
+        return int(incident_number.replace('-', ''))
+    except ValueError:
+        return hash(incident_number)
 
 class NotificationTracker:
-    """Tracks which incidents have already been notified to prevent duplicates."""
+    """
+    Tracks which incidents have already been notified to prevent duplicates.
+    
+    Notified incidents are persisted to a SQLite file so a restart does not
+    re-notify calls that are still active. Recently notified incidents are
+    also cached in memory so most checks never touch the database.
+    
+    Email delivery is recorded separately from ntfy.sh delivery, so an email
+    that went out is never re-sent while a failed ntfy.sh push is retried.
+    """
     
-    def __init__(self):
-        """Initialize the notification tracker with empty sets."""
-        self.notified_incidents = set()  # Set of incident numbers already notified
+    def __init__(self, db_path: str = DEFAULT_STATE_FILE, max_cached_incidents: int = MAX_TRACKED_INCIDENTS,
+                 retention: int = NOTIFICATION_RETENTION):
+        """
+        Initialize the notification tracker, creating the database if needed.
+        
+        Args:
+            db_path: Path to the SQLite state file (":memory:" disables persistence)
+            max_cached_incidents: Maximum number of incidents cached in memory;
+                the oldest are dropped from the cache first
+            retention: How long notified incidents are kept in the database (seconds)
+        """
+        self.notified_incidents = set()  # Cached keys of incidents already notified
+        self.notification_order = deque(maxlen=max_cached_incidents)  # Cached keys in insertion order
+        self.retention = retention
+        self.last_pruned = 0.0
+        self.lock = threading.Lock()  # Incidents are marked from notification worker threads
         self.logger = logging.getLogger(__name__)
+        
+        self.db = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("CREATE TABLE IF NOT EXISTS seen (inc TEXT PRIMARY KEY, ts INTEGER NOT NULL)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS seen_ts ON seen (ts)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS emailed (inc TEXT PRIMARY KEY, ts INTEGER NOT NULL)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS emailed_ts ON emailed (ts)")
+        self.prune()
+    
+    def cache_incident(self, key: int) -> None:
+        """
+        Add an incident key to the in-memory cache, evicting the oldest if full.
+        
+        Args:
+            key: Incident key from incident_key()
+        """
+        if key in self.notified_incidents:
+            return
+        
+        if len(self.notification_order) == self.notification_order.maxlen:
+            self.notified_incidents.discard(self.notification_order[0])
+        
+        self.notification_order.append(key)
+        self.notified_incidents.add(key)
     
     def is_already_notified(self, incident_number: str) -> bool:
         """
@@ -39,7 +223,17 @@ class NotificationTracker:
         Returns:
             True if already notified, False otherwise
         """
-        return incident_number in self.notified_incidents
+        key = incident_key(incident_number)
+        if key in self.notified_incidents:
+            return True
+        
+        with self.lock:
+            row = self.db.execute("SELECT 1 FROM seen WHERE inc = ?", (incident_number,)).fetchone()
+            if row is None:
+                return False
+            self.cache_incident(key)
+        
+        return True
     
     def mark_as_notified(self, incident_number: str) -> None:
         """
@@ -48,8 +242,62 @@ class NotificationTracker:
         Args:
             incident_number: Incident number to mark as notified
         """
-        self.notified_incidents.add(incident_number)
-        self.logger.debug(f"Marked incident {incident_number} as notified")
+        now = time.time()
+        
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO seen (inc, ts) VALUES (?, ?)",
+                (incident_number, int(now))
+            )
+            self.cache_incident(incident_key(incident_number))
+        
+        self.logger.debug("Marked incident %s as notified", incident_number)
+        
+        if now - self.last_pruned >= PRUNE_INTERVAL:
+            self.prune()
+    
+    def is_already_emailed(self, incident_number: str) -> bool:
+        """
+        Check if an email has already been sent for an incident.
+        
+        Args:
+            incident_number: Incident number to check
+            
+        Returns:
+            True if already emailed, False otherwise
+        """
+        with self.lock:
+            row = self.db.execute("SELECT 1 FROM emailed WHERE inc = ?", (incident_number,)).fetchone()
+        
+        return row is not None
+    
+    def mark_as_emailed(self, incident_number: str) -> None:
+        """
+        Mark an incident as emailed.
+        
+        Args:
+            incident_number: Incident number to mark as emailed
+        """
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO emailed (inc, ts) VALUES (?, ?)",
+                (incident_number, int(time.time()))
+            )
+        
+        self.logger.debug("Marked incident %s as emailed", incident_number)
+    
+    def prune(self) -> None:
+        """Delete incidents older than the retention period from the database."""
+        now = time.time()
+        cutoff = int(now - self.retention)
+        
+        with self.lock:
+            deleted = self.db.execute("DELETE FROM seen WHERE ts < ?", (cutoff,)).rowcount
+            self.db.execute("DELETE FROM emailed WHERE ts < ?", (cutoff,))
+            self.last_pruned = now
+        
+        if deleted:
+            self.logger.debug("Pruned %s expired incidents from the tracker", deleted)
     
     def get_notification_count(self) -> int:
         """
@@ -58,34 +306,43 @@ class NotificationTracker:
         Returns:
             Number of notified incidents
         """
-        return len(self.notified_incidents)
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PoliceCall:
-    """Data structure for a police call record."""
+    """
+    Data structure for a police call record.
+    
+    Calls are identified by their incident number: equality and hashing ignore
+    the other fields, and the hash is computed once and cached on the instance.
+    """
     incident_number: str
-    datetime_str: str
-    call_type: str
-    location: str
-    district: str
-    parsed_datetime: Optional[datetime] = None
-
-    def __post_init__(self):
-        """Parse the datetime string after initialization."""
-        try:
-            # Parse datetime format like "5/27/2025 13:16"
-            self.parsed_datetime = datetime.strptime(self.datetime_str, "%m/%d/%Y %H:%M")
-        except ValueError:
-            # If parsing fails, leave as None
-            pass
+    datetime_str: str = field(compare=False)
+    call_type: str = field(compare=False)
+    location: str = field(compare=False)
+    district: str = field(compare=False)
+    _hash: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        """Return the cached hash of the incident number, computing it on first use."""
+        if not self._hash:
+            # The dataclass is frozen, so the cache is set via object.__setattr__
+            object.__setattr__(self, '_hash', hash(self.incident_number))
+        return self._hash
 
 class Config:
     """Configuration class to hold all script settings."""
     
+    __slots__ = (
+        'ntfy_topic', 'search_term', 'search_needle', 'poll_interval', 'ntfy_url',
+        'resend_api_key', 'resend_headers', 'email_from', 'email_to', 'email_enabled', 'state_file'
+    )
+    
     def __init__(self, ntfy_topic: str, search_term: str = DEFAULT_SEARCH_TERM, 
                  poll_interval: int = DEFAULT_POLL_INTERVAL, 
                  resend_api_key: Optional[str] = None, email_to: Optional[str] = None,
-                 email_from: Optional[str] = None):
+                 email_from: Optional[str] = None, state_file: str = DEFAULT_STATE_FILE):
         """
         Initialize configuration.
         
@@ -96,14 +353,20 @@ class Config:
             resend_api_key: Resend API key for email notifications
             email_to: Email address to send notifications to
             email_from: Email address to send notifications from
+            state_file: SQLite file used to remember notified incidents
         """
         self.ntfy_topic = ntfy_topic
-        self.search_term = search_term.upper()  # Case insensitive search
+        self.search_term = search_term.upper()  # Uppercased for display
+        self.search_needle = search_term.casefold()  # Case-folded once for matching
         self.poll_interval = poll_interval
         self.ntfy_url = f"https://ntfy.sh/{ntfy_topic}"
         
         # Email configuration
         self.resend_api_key = resend_api_key
+        self.resend_headers = {
+            'Authorization': f'Bearer {resend_api_key}',
+            'Content-Type': 'application/json'
+        }
         self.email_from = email_from
         
         # Parse multiple email addresses (comma-separated)
@@ -113,6 +376,8 @@ class Config:
             self.email_to = []
             
         self.email_enabled = all([resend_api_key, self.email_to, email_from])
+        
+        self.state_file = state_file
 
 def parse_arguments() -> Config:
     """
@@ -135,10 +400,11 @@ Examples:
 Environment Variables:
   NTFY_TOPIC       - ntfy.sh topic name (required)
   SEARCH_TERM      - Search term for locations
-  POLL_INTERVAL    - Polling interval in seconds
+  POLL_INTERVAL    - Base polling interval in seconds (backs off while idle)
   RESEND_API_KEY   - Resend API key for email notifications
   EMAIL_TO         - Email address(es) for notifications
   EMAIL_FROM       - Email address to send from
+  STATE_FILE       - SQLite file for remembering notified incidents
   VERBOSE          - Enable verbose logging (true/false)
         """
     )
@@ -151,6 +417,7 @@ Environment Variables:
     env_resend_key = os.getenv('RESEND_API_KEY')
     env_email_to = os.getenv('EMAIL_TO')
     env_email_from = os.getenv('EMAIL_FROM')
+    env_state_file = os.getenv('STATE_FILE', DEFAULT_STATE_FILE)
     
     parser.add_argument(
         "--topic", 
@@ -169,7 +436,10 @@ Environment Variables:
         "--interval",
         type=int,
         default=env_interval,
-        help=f"Polling interval in seconds (default: {DEFAULT_POLL_INTERVAL})"
+        help=(
+            f"Base polling interval in seconds (default: {DEFAULT_POLL_INTERVAL}); doubles while "
+            f"the feed is unchanged, up to {MAX_IDLE_POLL_INTERVAL}s, and resets when it changes"
+        )
     )
     
     parser.add_argument(
@@ -197,6 +467,12 @@ Environment Variables:
         help="Email address to send notifications from"
     )
     
+    parser.add_argument(
+        "--state-file",
+        default=env_state_file,
+        help=f"SQLite file for remembering notified incidents across restarts (default: {DEFAULT_STATE_FILE})"
+    )
+    
     args = parser.parse_args()
     
     return Config(
@@ -205,7 +481,8 @@ Environment Variables:
         poll_interval=args.interval,
         resend_api_key=args.resend_api_key,
         email_to=args.email_to,
-        email_from=args.email_from
+        email_from=args.email_from,
+        state_file=args.state_file
     )
 
 def setup_logging(verbose: bool = False) -> None:
@@ -222,12 +499,21 @@ def setup_logging(verbose: bool = False) -> None:
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
-def fetch_active_calls() -> str:
+def fetch_active_calls(validators: Dict[str, str]) -> Optional[bytes]:
     """
     Fetch active calls data from Orlando PD XML endpoint.
     
+    Sends a conditional GET using the validators from the previous response, so
+    an unchanged feed costs a 304 with no body.
+    
+    Args:
+        validators: ETag / Last-Modified values from the previous response;
+            updated in place from this response
+    
     Returns:
-        Raw XML/text content from Orlando PD
+        Raw XML bytes from Orlando PD (left undecoded so the XML parser can
+        honor the BOM and encoding declaration itself), or None if the feed
+        has not changed since the last fetch
     
     Raises:
         requests.RequestException: If the HTTP request fails
@@ -235,18 +521,32 @@ def fetch_active_calls() -> str:
     logger = logging.getLogger(__name__)
     
     try:
-        logger.debug(f"Fetching data from {ORLANDO_PD_URL}")
+        logger.debug("Fetching data from %s", ORLANDO_PD_URL)
         
-        # Set timeout and headers for the request
-        headers = {
-            'User-Agent': 'Orlando-PD-Monitor/1.0'
-        }
+        # Only ask for the body if it changed since the last fetch
+        headers = {}
+        if 'ETag' in validators:
+            headers['If-None-Match'] = validators['ETag']
+        if 'Last-Modified' in validators:
+            headers['If-Modified-Since'] = validators['Last-Modified']
+        
+        response = HTTP_SESSION.get(ORLANDO_PD_URL, headers=headers, timeout=30)
+        
+        if response.status_code == 304:
+            logger.debug("Feed not modified since last fetch")
+            return None
         
-        response = requests.get(ORLANDO_PD_URL, headers=headers, timeout=30)
         response.raise_for_status()  # Raise exception for bad status codes
         
-        logger.debug(f"Successfully fetched {len(response.text)} characters of data")
-        return response.text
+        # Remember validators for the next conditional request
+        for header in ('ETag', 'Last-Modified'):
+            if header in response.headers:
+                validators[header] = response.headers[header]
+            else:
+                validators.pop(header, None)
+        
+        logger.debug("Successfully fetched %s bytes of data", len(response.content))
+        return response.content
         
     except requests.exceptions.Timeout:
         logger.error("Timeout while fetching Orlando PD data")
@@ -255,15 +555,34 @@ def fetch_active_calls() -> str:
         logger.error("Connection error while fetching Orlando PD data")
         raise
     except requests.exceptions.HTTPError as e:
-        logger.error(f"HTTP error while fetching Orlando PD data: {e}")
+        logger.error("HTTP error while fetching Orlando PD data: %s", e)
         raise
     except requests.exceptions.RequestException as e:
-        logger.error(f"Request error while fetching Orlando PD data: {e}")
+        logger.error("Request error while fetching Orlando PD data: %s", e)
         raise
 
-def parse_active_calls(raw_data: str) -> List[PoliceCall]:
+def release_element(element: ET._Element) -> None:
     """
-    Parse the XML data from Orlando PD into structured call records.
+    Free a fully-processed element and any siblings parsed before it.
+    
+    Used while stream-parsing so memory stays bounded by a single CALL
+    element instead of growing with the whole feed.
+    
+    Args:
+        element: Element whose "end" event has just been handled
+    """
+    element.clear()
+    while element.getprevious() is not None:
+        del element.getparent()[0]
+
+def iter_matching_new_calls(raw_data: bytes, search_needle: str, tracker: NotificationTracker) -> Iterator[PoliceCall]:
+    """
+    Stream the XML data from Orlando PD, yielding only calls that match the
+    search term and have not been notified yet.
+    
+    Parsing, location search and duplicate filtering happen in a single pass
+    over the feed, so non-matching calls are never turned into PoliceCall
+    objects and no intermediate lists are built.
     
     The data format is XML with structure:
     <CALLS>
@@ -277,167 +596,217 @@ def parse_active_calls(raw_data: str) -> List[PoliceCall]:
     </CALLS>
     
     Args:
-        raw_data: Raw XML content from Orlando PD endpoint
+        raw_data: Raw XML bytes from Orlando PD endpoint
+        search_needle: Case-folded term to search for in call locations
+        tracker: NotificationTracker used to skip already-notified incidents
         
-    Returns:
-        List of PoliceCall objects
+    Yields:
+        PoliceCall objects for new matching calls
     """
     logger = logging.getLogger(__name__)
-    calls = []
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)  # Checked once, used per CALL
     
     if not raw_data.strip():
         logger.warning("No data received from Orlando PD")
-        return calls
+        return
+    
+    calls_scanned = 0
     
     try:
-        # Remove BOM if present and clean up the XML data
-        clean_data = raw_data
-        if clean_data.startswith('\ufeff'):  # UTF-8 BOM
-            clean_data = clean_data[1:]
-        # Also try to remove the visible BOM characters that sometimes appear
-        if clean_data.startswith('ï»¿'):
-            clean_data = clean_data[3:]
-        
-        # Parse the XML data
-        root = ET.fromstring(clean_data)
-        
-        # Find all CALL elements
-        call_elements = root.findall('CALL')
-        
-        for call_element in call_elements:
-            # Extract data from XML elements
+        # Stream-parse the raw bytes so only one CALL element is held at a time;
+        # libxml2 handles the BOM and encoding declaration. Entities are left
+        # unresolved so a tampered feed cannot pull in local files or URLs
+        for _, call_element in ET.iterparse(
+            BytesIO(raw_data), events=('end',), tag='CALL',
+            resolve_entities=False, no_network=True
+        ):
+            calls_scanned += 1
+            
+            # Check the location first so non-matching calls cost as little as possible
+            location = call_element.findtext('LOCATION')
+            if location is None or search_needle not in location.casefold():
+                release_element(call_element)
+                continue
+            
+            # Skip incidents that have already been notified
             incident_number = call_element.get('incident', '')
-            date_elem = call_element.find('DATE')
-            desc_elem = call_element.find('DESC') 
-            location_elem = call_element.find('LOCATION')
-            district_elem = call_element.find('DISTRICT')
+            if tracker.is_already_notified(incident_number):
+                logger.debug("Skipping already notified incident %s", incident_number)
+                release_element(call_element)
+                continue
+            
+            # Extract text content (findtext returns None for a missing element)
+            datetime_str = call_element.findtext('DATE')
+            call_type = call_element.findtext('DESC')
+            district = call_element.findtext('DISTRICT')
+            release_element(call_element)
             
             # Skip if any required elements are missing
-            if not all([date_elem is not None, desc_elem is not None, 
-                       location_elem is not None, district_elem is not None]):
-                logger.debug(f"Skipping incomplete call record: {incident_number}")
+            if datetime_str is None or call_type is None or district is None:
+                logger.debug("Skipping incomplete call record: %s", incident_number)
                 continue
             
-            # Extract text content
-            datetime_str = date_elem.text.strip() if date_elem.text else ''
-            call_type = desc_elem.text.strip() if desc_elem.text else ''
-            location = location_elem.text.strip() if location_elem.text else ''
-            district = district_elem.text.strip() if district_elem.text else ''
-            
-            # Create PoliceCall object
             call = PoliceCall(
                 incident_number=incident_number,
-                datetime_str=datetime_str,
-                call_type=call_type,
-                location=location,
-                district=district
+                datetime_str=datetime_str.strip(),
+                call_type=call_type.strip(),
+                location=location.strip(),
+                district=district.strip()
             )
             
-            calls.append(call)
-            logger.debug(f"Parsed call: {incident_number} | {datetime_str} | {call_type} | {location} | {district}")
+            if debug_enabled:
+                logger.debug("MATCH FOUND: %s | %s | %s | %s | %s", call.incident_number, call.datetime_str, call.call_type, call.location, call.district)
+            
+            yield call
         
-        logger.info(f"Successfully parsed {len(calls)} active calls")
+        logger.info("Successfully scanned %s active calls", calls_scanned)
         
     except ET.ParseError as e:
-        logger.error(f"XML parsing error: {e}")
-        logger.debug(f"Raw data sample: {raw_data[:500]}...")
-    except Exception as e:
-        logger.error(f"Error parsing active calls data: {e}")
-        logger.debug(f"Raw data sample: {raw_data[:500]}...")
-    
-    return calls
+        logger.error("XML parsing error: %s", e)
+        logger.debug("Raw data sample: %r...", raw_data[:500])
 
-def search_calls_by_location(calls: List[PoliceCall], search_term: str) -> List[PoliceCall]:
+def split_notification_messages(new_calls: List[PoliceCall], search_term: str) -> List[Tuple[List[PoliceCall], str]]:
     """
-    Search police calls for a specific location term.
+    Group formatted calls into ntfy.sh messages of at most NTFY_MESSAGE_LIMIT bytes.
+    
+    ntfy.sh turns longer bodies into file attachments, so a large burst is
+    spread over as few messages as fit under the limit instead of one.
     
     Args:
-        calls: List of PoliceCall objects to search
-        search_term: Term to search for in call locations (case-insensitive)
+        new_calls: PoliceCall objects to format
+        search_term: The search term that triggered these notifications
         
     Returns:
-        List of PoliceCall objects that match the search term
+        List of (calls, message) pairs, one per ntfy.sh message
     """
-    logger = logging.getLogger(__name__)
-    matches = []
-    
-    if not calls:
-        logger.debug("No calls to search")
-        return matches
+    separator_size = len(NTFY_MESSAGE_SEPARATOR.encode('utf-8'))
+    messages = []
+    chunk_calls: List[PoliceCall] = []
+    chunk_parts: List[str] = []
+    chunk_size = 0
     
-    # Convert search term to uppercase for case-insensitive comparison
-    search_upper = search_term.upper()
+    for call in new_calls:
+        part = format_notification_message(call, search_term)
+        part_size = len(part.encode('utf-8'))
+        
+        if chunk_calls and chunk_size + separator_size + part_size > NTFY_MESSAGE_LIMIT:
+            messages.append((chunk_calls, NTFY_MESSAGE_SEPARATOR.join(chunk_parts)))
+            chunk_calls, chunk_parts, chunk_size = [], [], 0
+        
+        if chunk_calls:
+            chunk_size += separator_size
+        chunk_calls.append(call)
+        chunk_parts.append(part)
+        chunk_size += part_size
     
-    for call in calls:
-        # Check if search term is in the location (case-insensitive)
-        if search_upper in call.location.upper():
-            matches.append(call)
-            logger.debug(f"MATCH FOUND: {call.incident_number} | {call.location}")
+    if chunk_calls:
+        messages.append((chunk_calls, NTFY_MESSAGE_SEPARATOR.join(chunk_parts)))
     
-    logger.info(f"Found {len(matches)} calls matching '{search_term}' in location")
-    return matches
+    return messages
 
-def send_notification(call: PoliceCall, config: Config, tracker: NotificationTracker) -> bool:
+def send_ntfy_message(calls: List[PoliceCall], message: str, config: Config, tracker: NotificationTracker) -> int:
     """
-    Send a notification via ntfy.sh for a matching police call.
+    Post one coalesced ntfy.sh message and mark its calls as notified.
     
     Args:
-        call: PoliceCall object containing incident details
+        calls: PoliceCall objects covered by the message
+        message: Formatted message body
         config: Configuration object with ntfy settings
-        tracker: NotificationTracker to prevent duplicate notifications
+        tracker: NotificationTracker to record notified incidents in
         
     Returns:
-        True if notification was sent successfully, False otherwise
+        Number of calls notified, or 0 if the message could not be sent
     """
     logger = logging.getLogger(__name__)
-    
-    # Check if this incident has already been notified
-    if tracker.is_already_notified(call.incident_number):
-        logger.info(f"⏭️  Skipping duplicate notification for incident {call.incident_number}")
-        return False
+    incidents = ', '.join(call.incident_number for call in calls)
     
     try:
-        # Format the notification message
-        message = format_notification_message(call, config.search_term)
-        
         # Set up headers for the notification
+        if len(calls) == 1:
+            title = f"Orlando PD Alert: {config.search_term}"
+        else:
+            title = f"Orlando PD Alert: {config.search_term} ({len(calls)} matches)"
+        
         headers = {
-            "Title": f"Orlando PD Alert: {config.search_term}",
+            "Title": title,
             "Priority": "urgent", 
             "Tags": "police,alert,orlando"
         }
         
-        logger.debug(f"Sending notification to {config.ntfy_url}")
-        logger.debug(f"Message: {message}")
+        logger.debug("Sending notification to %s", config.ntfy_url)
+        logger.debug("Message: %s", message)
         
-        # Send the notification
-        response = requests.post(
+        # Send the notification over the shared keep-alive session
+        response = HTTP_SESSION.post(
             config.ntfy_url,
-            data=message,
+            data=message.encode('utf-8'),
             headers=headers,
             timeout=10
         )
         
         response.raise_for_status()
         
-        # Mark this incident as notified
-        tracker.mark_as_notified(call.incident_number)
+        # Mark every incident in the message as notified
+        for call in calls:
+            tracker.mark_as_notified(call.incident_number)
         
-        logger.info(f"✅ Notification sent successfully for incident {call.incident_number}")
-        return True
+        logger.info("✅ Notification sent successfully for incident(s) %s", incidents)
+        return len(calls)
         
     except requests.exceptions.Timeout:
-        logger.error(f"Timeout sending notification for incident {call.incident_number}")
-        return False
+        logger.error("Timeout sending notification for incident(s) %s", incidents)
+        return 0
     except requests.exceptions.ConnectionError:
-        logger.error(f"Connection error sending notification for incident {call.incident_number}")
-        return False
+        logger.error("Connection error sending notification for incident(s) %s", incidents)
+        return 0
     except requests.exceptions.HTTPError as e:
-        logger.error(f"HTTP error sending notification for incident {call.incident_number}: {e}")
-        return False
+        logger.error("HTTP error sending notification for incident(s) %s: %s", incidents, e)
+        return 0
     except Exception as e:
-        logger.error(f"Unexpected error sending notification for incident {call.incident_number}: {e}")
-        return False
+        logger.error("Unexpected error sending notification for incident(s) %s: %s", incidents, e)
+        return 0
+
+def send_notification(new_calls: List[PoliceCall], config: Config, tracker: NotificationTracker) -> int:
+    """
+    Send ntfy.sh notifications covering all new matching police calls.
+    
+    Coalescing a poll's matches costs one HTTP request and one phone alert per
+    NTFY_MESSAGE_LIMIT bytes of messages however many calls matched. Callers
+    filter out already-notified incidents beforehand (see
+    process_and_notify_matches).
+    
+    Args:
+        new_calls: PoliceCall objects for incidents not yet notified
+        config: Configuration object with ntfy settings
+        tracker: NotificationTracker to record notified incidents in
+        
+    Returns:
+        Number of calls included in successfully sent notifications
+    """
+    return sum(
+        send_ntfy_message(calls, message, config, tracker)
+        for calls, message in split_notification_messages(new_calls, config.search_term)
+    )
+
+def template_fields(call: PoliceCall, search_term: str) -> Dict[str, str]:
+    """
+    Collect the values substituted into the notification templates.
+    
+    Args:
+        call: PoliceCall object to format
+        search_term: The search term that triggered this notification
+        
+    Returns:
+        Dictionary of template field names to values
+    """
+    return {
+        "search_term": search_term,
+        "call_type": call.call_type,
+        "datetime_str": call.datetime_str,
+        "location": call.location,
+        "district": call.district,
+        "incident_number": call.incident_number
+    }
 
 def format_notification_message(call: PoliceCall, search_term: str) -> str:
     """
@@ -450,28 +819,44 @@ def format_notification_message(call: PoliceCall, search_term: str) -> str:
     Returns:
         Formatted notification message string
     """
-    message = f"""ORLANDO PD ALERT: {search_term}
+    return NTFY_MESSAGE_TEMPLATE.format_map(template_fields(call, search_term))
 
-Type: {call.call_type}
-Time: {call.datetime_str}
-Location: {call.location}
-District: {call.district}
-Incident: {call.incident_number}
-
-This call contains "{search_term}" in the location field."""
+def build_email_params(call: PoliceCall, config: Config) -> Dict:
+    """
+    Build the Resend email parameters for a matching police call.
+    
+    Args:
+        call: PoliceCall object containing incident details
+        config: Configuration object with email settings
+        
+    Returns:
+        Dictionary of Resend send parameters (from, to, subject, html, text)
+    """
+    fields = template_fields(call, config.search_term)
     
-    return message
+    return {
+        "from": config.email_from,
+        "to": config.email_to,  # List of email addresses
+        "subject": EMAIL_SUBJECT_TEMPLATE.format_map(fields),
+        "html": EMAIL_HTML_TEMPLATE.format_map(fields),
+        "text": EMAIL_TEXT_TEMPLATE.format_map(fields)
+    }
 
-def send_email_notification(call: PoliceCall, config: Config) -> bool:
+def send_email_notifications(calls: List[PoliceCall], config: Config, tracker: NotificationTracker) -> bool:
     """
-    Send an email notification via Resend for a matching police call.
+    Send email notifications via Resend for matching police calls.
+    
+    All emails go out through Resend's batch endpoint, so a burst of matches
+    costs one API request per RESEND_BATCH_LIMIT emails instead of one each.
+    Incidents are marked as emailed once their batch has been accepted.
     
     Args:
-        call: PoliceCall object containing incident details
+        calls: PoliceCall objects to send an email for
         config: Configuration object with email settings
+        tracker: NotificationTracker recording which incidents were emailed
         
     Returns:
-        True if email was sent successfully, False otherwise
+        True if every email was sent successfully, False otherwise
     """
     logger = logging.getLogger(__name__)
     
@@ -479,87 +864,38 @@ def send_email_notification(call: PoliceCall, config: Config) -> bool:
         logger.debug("Email notifications not configured, skipping email")
         return False
     
+    if not calls:
+        return True
+    
+    incidents = ', '.join(call.incident_number for call in calls)
+    
     try:
-        # Set up Resend API key
-        resend.api_key = config.resend_api_key
-        
-        # Format email content
-        subject = f"Orlando PD Alert: {config.search_term} - {call.call_type}"
+        logger.debug("Sending %s email(s) to %s", len(calls), ', '.join(config.email_to))
         
-        html_content = f"""
-        <html>
-        <body>
-            <h2>🚨 Orlando PD Alert: {config.search_term}</h2>
+        for start in range(0, len(calls), RESEND_BATCH_LIMIT):
+            batch = calls[start:start + RESEND_BATCH_LIMIT]
+            payloads = [build_email_params(call, config) for call in batch]
             
-            <table style="border-collapse: collapse; width: 100%; max-width: 600px;">
-                <tr style="background-color: #f8f9fa;">
-                    <td style="padding: 12px; border: 1px solid #ddd; font-weight: bold;">Incident Type:</td>
-                    <td style="padding: 12px; border: 1px solid #ddd;">{call.call_type}</td>
-                </tr>
-                <tr>
-                    <td style="padding: 12px; border: 1px solid #ddd; font-weight: bold;">Time:</td>
-                    <td style="padding: 12px; border: 1px solid #ddd;">{call.datetime_str}</td>
-                </tr>
-                <tr style="background-color: #f8f9fa;">
-                    <td style="padding: 12px; border: 1px solid #ddd; font-weight: bold;">Location:</td>
-                    <td style="padding: 12px; border: 1px solid #ddd; color: #d73502; font-weight: bold;">{call.location}</td>
-                </tr>
-                <tr>
-                    <td style="padding: 12px; border: 1px solid #ddd; font-weight: bold;">District:</td>
-                    <td style="padding: 12px; border: 1px solid #ddd;">{call.district}</td>
-                </tr>
-                <tr style="background-color: #f8f9fa;">
-                    <td style="padding: 12px; border: 1px solid #ddd; font-weight: bold;">Incident Number:</td>
-                    <td style="padding: 12px; border: 1px solid #ddd;">{call.incident_number}</td>
-                </tr>
-            </table>
+            # Serialize with orjson and post over the shared keep-alive session
+            response = HTTP_SESSION.post(
+                RESEND_BATCH_URL,
+                data=orjson.dumps(payloads),
+                headers=config.resend_headers,
+                timeout=10
+            )
+            response.raise_for_status()
             
-            <p style="margin-top: 20px; padding: 12px; background-color: #fff3cd; border: 1px solid #ffeeba; border-radius: 4px;">
-                <strong>Alert Reason:</strong> This call contains "<strong>{config.search_term}</strong>" in the location field.
-            </p>
+            # Record the batch as delivered so it is never emailed again
+            for call in batch:
+                tracker.mark_as_emailed(call.incident_number)
             
-            <p style="color: #6c757d; font-size: 12px; margin-top: 20px;">
-                This is an automated notification from Orlando PD Monitor.<br>
-                Data source: Orlando Police Department Active Calls Feed
-            </p>
-        </body>
-        </html>
-        """
+            email_ids = ', '.join(email['id'] for email in response.json()['data'])
+            logger.info("📧 Email notifications sent successfully for %s incident(s) (IDs: %s)", len(batch), email_ids)
         
-        text_content = f"""
-Orlando PD Alert: {config.search_term}
-
-Incident Type: {call.call_type}
-Time: {call.datetime_str}
-Location: {call.location}
-District: {call.district}
-Incident Number: {call.incident_number}
-
-Alert Reason: This call contains "{config.search_term}" in the location field.
-
----
-This is an automated notification from Orlando PD Monitor.
-Data source: Orlando Police Department Active Calls Feed
-        """
-        
-        logger.debug(f"Sending email to {', '.join(config.email_to)}")
-        
-        # Send the email
-        params = {
-            "from": config.email_from,
-            "to": config.email_to,  # Now a list of email addresses
-            "subject": subject,
-            "html": html_content,
-            "text": text_content
-        }
-        
-        response = resend.Emails.send(params)
-        
-        logger.info(f"📧 Email notification sent successfully for incident {call.incident_number} (ID: {response['id']})")
         return True
         
     except Exception as e:
-        logger.error(f"Failed to send email notification for incident {call.incident_number}: {e}")
+        logger.error("Failed to send email notifications for incidents %s: %s", incidents, e)
         return False
 
 def process_and_notify_matches(matching_calls: List[PoliceCall], config: Config, tracker: NotificationTracker) -> int:
@@ -581,33 +917,141 @@ def process_and_notify_matches(matching_calls: List[PoliceCall], config: Config,
         logger.info("No matching calls to process")
         return notifications_sent
     
-    logger.info(f"Processing {len(matching_calls)} matching calls...")
+    logger.info("Processing %s matching calls...", len(matching_calls))
     
+    # iter_matching_new_calls already dropped notified incidents; the pending set
+    # catches an incident listed more than once in the same feed
+    new_calls = []
+    pending_calls = set()
     for call in matching_calls:
+        if call in pending_calls:
+            logger.info("⏭️  Skipping duplicate notification for incident %s", call.incident_number)
+        else:
+            pending_calls.add(call)
+            new_calls.append(call)
+    
+    if new_calls:
+        # New calls go out as coalesced ntfy.sh messages and Resend batches, sent concurrently
+        ntfy_future = NOTIFICATION_EXECUTOR.submit(send_notification, new_calls, config, tracker)
+        email_future = None
+        if config.email_enabled:
+            # An incident whose ntfy.sh push failed earlier may already have been emailed
+            email_calls = [call for call in new_calls if not tracker.is_already_emailed(call.incident_number)]
+            if email_calls:
+                email_future = NOTIFICATION_EXECUTOR.submit(send_email_notifications, email_calls, config, tracker)
+        
         try:
-            # Send ntfy.sh notification
-            ntfy_success = send_notification(call, config, tracker)
-            
-            # Send email notification (only if not a duplicate)
-            email_success = False
-            if ntfy_success:  # Only send email if ntfy succeeded (not a duplicate)
-                email_success = send_email_notification(call, config)
-            
-            if ntfy_success:
-                notifications_sent += 1
+            # Only ntfy.sh delivery counts towards (and is tracked as) a notification
+            notifications_sent = ntfy_future.result()
                 
         except Exception as e:
-            logger.error(f"Error processing notifications for incident {call.incident_number}: {e}")
+            logger.error("Error processing notifications: %s", e)
+        
+        if email_future is not None:
+            try:
+                email_future.result()
+            except Exception as e:
+                logger.error("Error processing email notifications: %s", e)
     
-    logger.info(f"📊 Summary: {notifications_sent} new notifications sent, {len(matching_calls) - notifications_sent} duplicates skipped")
-    logger.info(f"📊 Total incidents tracked: {tracker.get_notification_count()}")
+    logger.info("📊 Summary: %s new notifications sent, %s duplicates skipped", notifications_sent, len(matching_calls) - len(new_calls))
+    logger.info("📊 Total incidents tracked: %s", tracker.get_notification_count())
     
     return notifications_sent
 
+def get_poll_interval(poll_interval: int, unchanged_polls: int) -> int:
+    """
+    Compute how long to wait before the next poll.
+    
+    The interval doubles for each consecutive poll that saw an unchanged feed,
+    capped at MAX_IDLE_POLL_INTERVAL, and resets as soon as the feed changes.
+    
+    Args:
+        poll_interval: Configured base polling interval (seconds)
+        unchanged_polls: Number of consecutive polls with an unchanged feed
+        
+    Returns:
+        Seconds to sleep before the next poll
+    """
+    backoff = poll_interval * (2 ** min(unchanged_polls, 8))
+    return max(poll_interval, min(backoff, MAX_IDLE_POLL_INTERVAL))
+
+class FeedChecker:
+    """
+    Runs a single fetch, match and notify cycle against the Orlando PD feed.
+    
+    Kept separate from the polling schedule in monitor_loop so the same check
+    can be triggered by any event source, not just a timer.
+    """
+    
+    def __init__(self, config: Config, tracker: NotificationTracker):
+        """
+        Initialize the feed checker.
+        
+        Args:
+            config: Configuration object with all settings
+            tracker: NotificationTracker to prevent duplicate notifications
+        """
+        self.config = config
+        self.tracker = tracker
+        self.last_feed_hash: Optional[bytes] = None  # Fingerprint of the last fully processed feed
+        self.feed_validators: Dict[str, str] = {}  # ETag / Last-Modified for conditional GETs
+        self.logger = logging.getLogger(__name__)
+    
+    def check_for_new_calls(self) -> bool:
+        """
+        Fetch the feed and send notifications for any new matching calls.
+        
+        Returns:
+            True if the feed changed since the last check, False otherwise
+        
+        Raises:
+            requests.RequestException: If fetching the feed fails
+        """
+        config = self.config
+        tracker = self.tracker
+        
+        # Fetch active calls (None means the server answered 304 Not Modified)
+        raw_data = fetch_active_calls(self.feed_validators)
+        feed_hash = hashlib.blake2b(raw_data, digest_size=16).digest() if raw_data is not None else None
+        
+        if raw_data is None or feed_hash == self.last_feed_hash:
+            # Feed unchanged since the last check, so there is nothing new to parse
+            self.logger.debug("Feed unchanged since last poll, skipping parse")
+            return False
+        
+        # Parse, search and drop duplicates in a single pass over the feed
+        matching_calls = list(iter_matching_new_calls(raw_data, config.search_needle, tracker))
+        
+        if matching_calls:
+            self.logger.info("🚨 MATCH FOUND! %s calls contain '%s'", len(matching_calls), config.search_term)
+            
+            # Process notifications (will skip duplicates automatically)
+            notifications_sent = process_and_notify_matches(matching_calls, config, tracker)
+            
+            if notifications_sent > 0:
+                self.logger.info("🔔 Sent %s new notifications", notifications_sent)
+            else:
+                self.logger.debug("No new notifications (all were duplicates)")
+        else:
+            self.logger.debug("No new calls found containing '%s'", config.search_term)
+        
+        # Only treat the feed as seen once every match has been notified, so
+        # failed notifications are retried on the next check
+        if all(tracker.is_already_notified(call.incident_number) for call in matching_calls):
+            self.last_feed_hash = feed_hash
+        else:
+            self.last_feed_hash = None
+            self.feed_validators.clear()
+        
+        return True
+
 def monitor_loop(config: Config, tracker: NotificationTracker) -> None:
     """
     Main monitoring loop that continuously checks for new incidents.
     
+    Handles scheduling only (polling interval, idle backoff, error retries);
+    each check itself is done by FeedChecker.
+    
     Args:
         config: Configuration object with all settings
         tracker: NotificationTracker to prevent duplicate notifications
@@ -616,68 +1060,56 @@ def monitor_loop(config: Config, tracker: NotificationTracker) -> None:
     loop_count = 0
     consecutive_errors = 0
     max_consecutive_errors = 5
+    feed_checker = FeedChecker(config, tracker)
+    unchanged_polls = 0
     
     while True:
         try:
             loop_count += 1
-            logger.debug(f"🔄 Monitoring loop #{loop_count}")
-            
-            # Fetch and parse active calls
-            raw_data = fetch_active_calls()
-            active_calls = parse_active_calls(raw_data)
-            
-            logger.info(f"📋 Retrieved {len(active_calls)} active calls")
-            
-            # Search for matching calls
-            matching_calls = search_calls_by_location(active_calls, config.search_term)
+            logger.debug("🔄 Monitoring loop #%s", loop_count)
             
-            if matching_calls:
-                logger.info(f"🚨 MATCH FOUND! {len(matching_calls)} calls contain '{config.search_term}'")
-                
-                # Process notifications (will skip duplicates automatically)
-                notifications_sent = process_and_notify_matches(matching_calls, config, tracker)
-                
-                if notifications_sent > 0:
-                    logger.info(f"🔔 Sent {notifications_sent} new notifications")
-                else:
-                    logger.debug("No new notifications (all were duplicates)")
+            if feed_checker.check_for_new_calls():
+                unchanged_polls = 0
             else:
-                logger.debug(f"No calls found containing '{config.search_term}'")
+                unchanged_polls += 1
             
             # Reset error counter on successful iteration
             consecutive_errors = 0
             
-            # Wait for next polling interval
-            logger.debug(f"💤 Sleeping for {config.poll_interval} seconds...")
-            time.sleep(config.poll_interval)
+            # Wait for next polling interval, backing off while the feed is idle
+            sleep_time = get_poll_interval(config.poll_interval, unchanged_polls)
+            logger.debug("💤 Sleeping for %s seconds...", sleep_time)
+            time.sleep(sleep_time)
             
         except requests.exceptions.RequestException as e:
             consecutive_errors += 1
-            logger.error(f"Network error (attempt {consecutive_errors}): {e}")
+            logger.error("Network error (attempt %s): %s", consecutive_errors, e)
             
             if consecutive_errors >= max_consecutive_errors:
-                logger.error(f"Too many consecutive network errors ({consecutive_errors}). Stopping monitor.")
+                logger.error("Too many consecutive network errors (%s). Stopping monitor.", consecutive_errors)
                 raise
             
             # Exponential backoff for network errors
             backoff_time = min(300, 30 * (2 ** (consecutive_errors - 1)))  # Max 5 minutes
-            logger.info(f"⏳ Waiting {backoff_time} seconds before retry...")
+            logger.info("⏳ Waiting %s seconds before retry...", backoff_time)
             time.sleep(backoff_time)
             
         except Exception as e:
             consecutive_errors += 1
-            logger.error(f"Unexpected error in monitoring loop (attempt {consecutive_errors}): {e}")
+            logger.error("Unexpected error in monitoring loop (attempt %s): %s", consecutive_errors, e)
             
             if consecutive_errors >= max_consecutive_errors:
-                logger.error(f"Too many consecutive errors ({consecutive_errors}). Stopping monitor.")
+                logger.error("Too many consecutive errors (%s). Stopping monitor.", consecutive_errors)
                 raise
             
             # Wait before retrying
-            logger.info(f"⏳ Waiting 60 seconds before retry...")
+            logger.info("⏳ Waiting 60 seconds before retry...")
             time.sleep(60)
 
 def main():
     """Main entry point for the Orlando PD monitor."""
+    tracker = None
+    
     try:
         # Parse configuration
         config = parse_arguments()
@@ -687,32 +1119,35 @@ def main():
         
         logger = logging.getLogger(__name__)
         logger.info("Orlando PD Monitor starting...")
-        logger.info(f"Configuration: Topic={config.ntfy_topic}, Search={config.search_term}, Interval={config.poll_interval}s")
+        logger.info("Configuration: Topic=%s, Search=%s, Interval=%ss", config.ntfy_topic, config.search_term, config.poll_interval)
         
         if config.email_enabled:
             recipients = ', '.join(config.email_to)
-            logger.info(f"📧 Email notifications enabled: {config.email_from} → {recipients}")
+            logger.info("📧 Email notifications enabled: %s → %s", config.email_from, recipients)
         else:
             logger.info("📧 Email notifications disabled (missing configuration)")
         
         # Initialize notification tracker
-        tracker = NotificationTracker()
-        logger.info("Notification tracker initialized")
+        tracker = NotificationTracker(config.state_file)
+        logger.info("Notification tracker initialized from %s (%s incidents remembered)",
+                    config.state_file, tracker.get_notification_count())
         
         # Start continuous monitoring
-        logger.info(f"🔄 Starting continuous monitoring (polling every {config.poll_interval} seconds)")
-        logger.info(f"🔍 Searching for '{config.search_term}' in call locations")
-        logger.info(f"📡 Notifications will be sent to: {config.ntfy_topic}")
+        logger.info("🔄 Starting continuous monitoring (polling every %s seconds)", config.poll_interval)
+        logger.info("🔍 Searching for '%s' in call locations", config.search_term)
+        logger.info("📡 Notifications will be sent to: %s", config.ntfy_topic)
         logger.info("Press Ctrl+C to stop monitoring")
         
         monitor_loop(config, tracker)
         
     except KeyboardInterrupt:
         logging.info("🛑 Monitor stopped by user")
-        logging.info(f"📊 Final summary: {tracker.get_notification_count()} total notifications sent during this session")
+        if tracker is not None:
+            logging.info("📊 Final summary: %s notified incidents tracked (including earlier runs)", tracker.get_notification_count())
     except Exception as e:
-        logging.error(f"💥 Fatal error: {e}")
-        logging.info(f"📊 Final summary: {tracker.get_notification_count()} total notifications sent before error")
+        logging.error("💥 Fatal error: %s", e)
+        if tracker is not None:
+            logging.info("📊 Final summary: %s notified incidents tracked before error (including earlier runs)", tracker.get_notification_count())
         sys.exit(1)
 
 if __name__ == "__main__":